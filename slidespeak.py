@@ -4,14 +4,22 @@ SlideSpeak MCP Server - FastMCP Implementation with Streamable HTTP
 Deployable on Railway for remote access via Claude Desktop
 """
 
-from typing import Any, Optional, Literal, Dict, List
+from typing import Any, Callable, Optional, Literal, Dict, List
+import aiofiles
+import aiofiles.os
+import hashlib
 import httpx
 import os
+import random
+import re
+import sys
 import time
+import weakref
 import asyncio
 import logging
 import json
 import warnings
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pydantic import Field
 
@@ -22,6 +30,19 @@ warnings.filterwarnings("ignore", category=DeprecationWarning, module="uvicorn")
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 
+# orjson is much faster for the response parsing done on every poll; fall
+# back to the standard library if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# HTTP/2 needs the h2 package (the httpx[http2] extra); without it we stay on HTTP/1.1
+try:
+    import h2
+except ImportError:
+    h2 = None
+
 # --- Configuration & Logging ---
 
 # Configure comprehensive logging
@@ -37,9 +58,51 @@ USER_AGENT = "slidespeak-mcp/1.0.0"
 
 # Default Timeouts
 DEFAULT_TIMEOUT = 30.0
-GENERATION_TIMEOUT = 90.0  # Total time allowed for generation + polling
-POLLING_INTERVAL = 2.0  # Seconds between status checks
+GENERATION_TIMEOUT = 90.0  # Timeout for the generation request, and the polling window after it
+POLL_DELAYS = (0.25, 0.25, 0.5, 0.5, 1.0, 1.0, 2.0)  # Seconds between status checks; the last repeats
+POLL_JITTER = 0.5  # Each delay is scaled by a random factor in [1 - POLL_JITTER, 1 + POLL_JITTER]
+POLL_DEADLINE_MARGIN = 0.5  # Seconds before the deadline to make a final status check
+POLL_MAX_FAILURES = 6  # Consecutive failed status checks before giving up on a task
+POLL_FAILURE_BACKOFF_MAX = 30.0  # Cap on the jittered delay after failed status checks
 POLLING_TIMEOUT = 10.0  # Timeout for each individual status check request
+CATALOG_TTL = 300.0  # Seconds to reuse the formatted template and theme lists
+
+# Task states reported by /task_status
+TASK_SUCCESS = "SUCCESS"
+TASK_FAILED_STATES = frozenset({"FAILED", "FAILURE"})
+TASK_TERMINAL_STATES = TASK_FAILED_STATES | {TASK_SUCCESS}
+TASK_PENDING_STATES = frozenset({"PENDING", "PROCESSING", "SENT", "STARTED", "RETRY"})
+
+# (min, max) item_amount accepted by each slide-by-slide layout
+_LAYOUT_CONSTRAINTS: dict[str, tuple[int, int]] = {
+    "items": (1, 5),
+    "steps": (3, 5),
+    "summary": (1, 5),
+    "comparison": (2, 2),
+    "big-number": (1, 5),
+    "milestone": (3, 5),
+    "pestel": (6, 6),
+    "swot": (4, 4),
+    "pyramid": (1, 5),
+    "timeline": (3, 5),
+    "funnel": (3, 5),
+    "quote": (1, 1),
+    "cycle": (3, 5),
+    "thanks": (0, 0),
+}
+# Slide keys the slide-by-slide endpoint reads; anything else is dropped before sending
+_SLIDE_FIELDS = ("title", "layout", "item_amount", "content")
+
+# Connection pool for the shared SlideSpeak client; sized for concurrent tool calls
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=300.0)
+MAX_CONCURRENT_REQUESTS = 20  # Cap on in-flight SlideSpeak API requests across all tool calls
+RETRY_ATTEMPTS = 3  # Total attempts for requests that hit a transient error status
+CONNECT_RETRIES = 2  # Connection failures retried by the transport before any bytes are sent
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+# A 502/504 on a POST may mean the job was accepted upstream, so only retry rejections
+POST_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+# /task_status can briefly 404/425 for a task created a moment ago
+TASK_NOT_READY_STATUS_CODES = frozenset({404, 425})
 
 # Get server URL from environment (Railway provides RAILWAY_PUBLIC_DOMAIN)
 public_domain = os.environ.get("RAILWAY_PUBLIC_DOMAIN")
@@ -67,99 +130,620 @@ if not API_KEY:
 else:
     logger.info("✅ SlideSpeak API key configured")
 
+# Headers sent with every SlideSpeak request, built once after API_KEY is read
+_DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/json",
+    "X-API-Key": API_KEY or "",
+}
+
+# Shared HTTP client: one keep-alive connection pool for every SlideSpeak call,
+# so status polling doesn't pay a fresh TCP + TLS handshake per request. HTTP/2
+# lets concurrent polls share a single connection; httpx already negotiates
+# gzip/deflate response compression by default.
+_client: Optional[httpx.AsyncClient] = None
+# Set once the negotiated protocol has been logged for the first response
+_http_version_logged = False
+
+def _get_client() -> httpx.AsyncClient:
+    """Returns the shared SlideSpeak client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=API_BASE,
+            headers=_DEFAULT_HEADERS,
+            timeout=DEFAULT_TIMEOUT,
+            # The client ignores limits/http2 when given a transport, so they live here
+            transport=httpx.AsyncHTTPTransport(
+                retries=CONNECT_RETRIES,
+                limits=HTTP_LIMITS,
+                http2=h2 is not None,
+            ),
+        )
+    return _client
+
+async def _close_client() -> None:
+    """Closes the shared SlideSpeak client if it was ever opened."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("🔌 SlideSpeak HTTP client closed")
+
+# Bounds concurrent outbound requests so parallel generations can't flood the API
+_api_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
 # --- Helper Functions ---
 
-async def _make_api_request(
+# Bound directly (no wrapper frame) since it runs on every status poll
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+def _json_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serializes to compact UTF-8 JSON bytes for request bodies, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys).encode()
+
+# Per-request header for the pre-serialized JSON bodies sent with POSTs. Built as
+# httpx.Headers so each request copies it instead of re-encoding a dict.
+_JSON_CONTENT_HEADERS = httpx.Headers({"Content-Type": "application/json"})
+
+def _json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serializes to a JSON string with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+@dataclass(slots=True)
+class ApiResult:
+    """Outcome of an API call: the body on success, plus the server's Retry-After hint on failure."""
+    status: Optional[int]  # None when no response was received
+    content: Optional[bytes] = None
+    retry_after: Optional[float] = None
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, capped at DEFAULT_TIMEOUT, or None."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), DEFAULT_TIMEOUT)
+        except ValueError:
+            pass  # HTTP-date form; callers fall back to their own backoff
+    return None
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring Retry-After when the API sends it."""
+    retry_after = _retry_after(response)
+    if retry_after is not None:
+        return retry_after
+    return min(0.2 * 2 ** attempt, 2.0) + random.uniform(0, 0.1)
+
+async def _send_api_request(
     method: Literal["GET", "POST"],
     endpoint: str,
-    payload: Optional[dict[str, Any]] = None,
+    payload: Optional[dict[str, Any] | bytes] = None,
     timeout: float = DEFAULT_TIMEOUT
-) -> Optional[dict[str, Any]]:
+) -> ApiResult:
     """
     Makes an HTTP request to the SlideSpeak API with comprehensive logging.
 
+    Transient errors (429/502/503/504; only 429/503 for POST) are retried up
+    to RETRY_ATTEMPTS times with jittered exponential backoff. Callers are
+    expected to have checked API_KEY already; every tool does so on entry.
+
     Args:
         method: HTTP method ('GET' or 'POST').
         endpoint: API endpoint path (e.g., '/presentation/templates').
-        payload: JSON payload for POST requests. Ignored for GET.
+        payload: JSON payload for POST requests, or its already-encoded bytes. Ignored for GET.
         timeout: Request timeout in seconds.
 
     Returns:
-        The parsed JSON response as a dictionary on success, None on failure.
+        An ApiResult whose content is the raw response body on success and
+        None on failure. A final 429/503 carries the server's Retry-After.
     """
-    if not API_KEY:
-        logger.error("❌ API Key is missing. Cannot make API request.")
-        return None
+    global _http_version_logged
 
-    headers = {
-        "User-Agent": USER_AGENT,
-        "Accept": "application/json",
-        "X-API-Key": API_KEY,
-    }
+    logger.info("🔄 Making %s request to: %s", method, endpoint)
+    if payload and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📤 Request payload: %s", payload.decode() if isinstance(payload, bytes) else _json_dumps(payload, indent=True))
 
-    # Construct full URL
-    url = f"{API_BASE}{endpoint}"
-    
-    logger.info(f"🔄 Making {method} request to: {endpoint}")
-    if payload:
-        logger.debug(f"📤 Request payload: {json.dumps(payload, indent=2)}")
+    # Encoded here rather than via json=, so the body is serialized once and reused by retries
+    body = None
+    if method == "POST" and payload is not None:
+        body = payload if isinstance(payload, bytes) else _json_bytes(payload)
+    headers = _JSON_CONTENT_HEADERS if body is not None else None
 
-    async with httpx.AsyncClient() as client:
+    for attempt in range(RETRY_ATTEMPTS):
         try:
-            if method == "POST":
-                response = await client.post(url, json=payload, headers=headers, timeout=timeout)
-            else:  # Default to GET
-                response = await client.get(url, headers=headers, timeout=timeout)
-
-            logger.info(f"📥 Response status: {response.status_code}")
+            async with _api_semaphore:
+                response = await _get_client().request(
+                    method,
+                    endpoint,
+                    content=body,
+                    headers=headers,
+                    timeout=timeout,
+                )
+
+            logger.info("📥 Response status: %d", response.status_code)
+            if not _http_version_logged:
+                _http_version_logged = True
+                logger.debug("🌐 Negotiated %s with %s", response.http_version, API_BASE)
+
+            retryable = POST_RETRYABLE_STATUS_CODES if method == "POST" else RETRYABLE_STATUS_CODES
+            if response.status_code in retryable and attempt < RETRY_ATTEMPTS - 1:
+                delay = _retry_delay(response, attempt)
+                logger.warning("⚠️  %s %s returned %d; retrying in %.2fs", method, endpoint, response.status_code, delay)
+                await asyncio.sleep(delay)
+                continue
             
+            if response.status_code in TASK_NOT_READY_STATUS_CODES and endpoint.startswith("/task_status/"):
+                # Not an error worth a traceback or an ERROR line; callers decide what it means
+                logger.debug("⏳ %s returned %d; task not visible yet", endpoint, response.status_code)
+                return ApiResult(response.status_code)
+
             response.raise_for_status()  # Raise exception for 4xx or 5xx status codes
-            
-            result = response.json()
-            logger.debug(f"📦 Response data: {json.dumps(result, indent=2)[:500]}...")  # Log first 500 chars
-            
-            return result
+            return ApiResult(response.status_code, response.content)
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"❌ HTTP error calling {method} {url}: {e.response.status_code}")
-            logger.error(f"❌ Response text: {e.response.text}")
-            return None
+            logger.error("❌ HTTP error calling %s %s%s: %d", method, API_BASE, endpoint, e.response.status_code)
+            logger.error("❌ Response text: %s", e.response.text)
+            status = e.response.status_code
+            return ApiResult(status, retry_after=_retry_after(e.response) if status in (429, 503) else None)
         except httpx.RequestError as e:
-            logger.error(f"❌ Request error calling {method} {url}: {str(e)}")
-            return None
+            # Connect failures have already been retried by the transport
+            logger.error("❌ Request error calling %s %s%s: %s", method, API_BASE, endpoint, e)
+            return ApiResult(None)
         except Exception as e:
-            logger.error(f"❌ Unexpected error calling {method} {url}: {str(e)}")
-            return None
+            logger.error("❌ Unexpected error calling %s %s%s: %s", method, API_BASE, endpoint, e)
+            return ApiResult(None)
+
+    return ApiResult(None)
+
+def _parse_response(method: str, endpoint: str, raw: bytes) -> Optional[Any]:
+    """Parses a JSON response body, logging and returning None if it is malformed."""
+    try:
+        result = _json_loads(raw)
+    except ValueError as e:
+        logger.error("❌ Invalid JSON from %s %s%s: %s", method, API_BASE, endpoint, e)
+        return None
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📦 Response data: %s...", _json_dumps(result, indent=True)[:500])  # Log first 500 chars
+    return result
+
+async def _make_api_request(
+    method: Literal["GET", "POST"],
+    endpoint: str,
+    payload: Optional[dict[str, Any] | bytes] = None,
+    timeout: float = DEFAULT_TIMEOUT
+) -> Optional[dict[str, Any]]:
+    """
+    Makes an HTTP request to the SlideSpeak API and parses the JSON response.
+
+    Takes the same arguments as _send_api_request.
+
+    Returns:
+        The parsed JSON response as a dictionary on success, None on failure.
+    """
+    raw = (await _send_api_request(method, endpoint, payload=payload, timeout=timeout)).content
+    if raw is None:
+        return None
+    return _parse_response(method, endpoint, raw)
+
+# Status responses smaller than this are scanned for task_status without a full
+# JSON parse; larger ones may nest other objects, so they are always parsed
+_STATUS_SCAN_MAX_BYTES = 512
+_TASK_STATUS_RE = re.compile(rb'"task_status"\s*:\s*"([A-Za-z_]+)"')
+
+def _scan_pending_status(raw: bytes) -> Optional[str]:
+    """Returns the task status if a small status body is still pending, without parsing it."""
+    if len(raw) <= _STATUS_SCAN_MAX_BYTES:
+        match = _TASK_STATUS_RE.search(raw)
+        if match:
+            task_status = match.group(1).decode()
+            if task_status in TASK_PENDING_STATES:
+                return task_status
+    return None
+
+@dataclass(slots=True)
+class TaskStatus:
+    """A /task_status envelope, unpacked once so the poll loop reads attributes."""
+    task_status: Optional[str]
+    task_result: Any = None
+    envelope: Optional[dict[str, Any]] = None  # Full response, reported when there's no result
+
+def _parse_status(data: Any) -> Optional[TaskStatus]:
+    """Builds a TaskStatus from a decoded status response, or None if it's empty or not an object."""
+    if not isinstance(data, dict) or not data:
+        return None
+    return TaskStatus(data.get("task_status"), data.get("task_result"), data)
+
+# /task_status/{id}/stream isn't a documented endpoint, so probing it is opt-in
+STATUS_STREAMING = os.environ.get("SLIDESPEAK_STATUS_STREAMING", "").lower() in ("1", "true", "yes")
+
+# Whether the API serves /task_status/{id}/stream; None until the first attempt
+_status_stream_supported: Optional[bool] = None if STATUS_STREAMING else False
+# Consecutive 404s from the stream endpoint. A single 404 may just be a task that
+# isn't visible yet, so streaming is only given up after several in a row.
+_stream_not_found_count = 0
+STREAM_MAX_NOT_FOUND = 3
+STREAM_IDLE_TIMEOUT = 20.0  # Seconds without any stream data before falling back to polling
+# Content types that mean the endpoint really is a status stream
+_STREAM_CONTENT_TYPES = frozenset({"text/event-stream", "application/x-ndjson", "application/ndjson"})
+
+# Per-request override layered on the client's default headers for status streams
+_STREAM_HEADERS = httpx.Headers({"Accept": "text/event-stream"})
+
+async def _stream_task_status(task_id: str) -> Optional[TaskStatus]:
+    """
+    Waits for a terminal task status on the streaming status endpoint.
+
+    Only used when SLIDESPEAK_STATUS_STREAMING is set. The stream is expected
+    to emit one JSON status object per line (optionally as SSE `data:` lines).
+    Any non-2xx response other than a 404, a response that isn't an event
+    stream or NDJSON, or STREAM_MAX_NOT_FOUND consecutive 404s mark streaming
+    as unsupported for the rest of the process so later tasks go straight to
+    polling. A stream that stays silent for STREAM_IDLE_TIMEOUT is abandoned.
+
+    Returns:
+        The SUCCESS/FAILED status object, or None if streaming is unavailable
+        or the stream ended early.
+    """
+    global _status_stream_supported, _stream_not_found_count
+    if _status_stream_supported is False:
+        return None
+
+    stream_endpoint = f"/task_status/{task_id}/stream"
+    try:
+        async with _get_client().stream(
+            "GET",
+            stream_endpoint,
+            headers=_STREAM_HEADERS,
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT, read=STREAM_IDLE_TIMEOUT),
+        ) as response:
+            if response.status_code == 404:
+                _stream_not_found_count += 1
+                if _stream_not_found_count >= STREAM_MAX_NOT_FOUND:
+                    logger.info("ℹ️  Streaming task status not supported; falling back to polling")
+                    _status_stream_supported = False
+                return None
+            if not response.is_success:
+                logger.info("ℹ️  Streaming task status not supported (%d); falling back to polling", response.status_code)
+                _status_stream_supported = False
+                return None
+
+            content_type = response.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+            if content_type not in _STREAM_CONTENT_TYPES:
+                logger.info("ℹ️  Status stream answered with %s; falling back to polling", content_type or "no content type")
+                _status_stream_supported = False
+                return None
+
+            _status_stream_supported = True
+            _stream_not_found_count = 0
+            logger.info("📡 Streaming status for task %s", task_id)
+
+            # Enforced here as well as by the read timeout, which not every transport honours
+            loop = asyncio.get_running_loop()
+            async with asyncio.timeout(STREAM_IDLE_TIMEOUT) as idle:
+                async for line in response.aiter_lines():
+                    idle.reschedule(loop.time() + STREAM_IDLE_TIMEOUT)
+                    if line.startswith("data:"):
+                        line = line[5:]
+                    line = line.strip()
+                    if not line.startswith("{"):
+                        continue  # Blank keep-alives, comments and event names
+                    try:
+                        event = _json_loads(line)
+                    except ValueError:
+                        continue
+                    status = _parse_status(event)
+                    if status is not None and status.task_status in TASK_TERMINAL_STATES:
+                        return status
+    except asyncio.TimeoutError:
+        logger.warning("⚠️  Status stream for task %s went idle; falling back to polling", task_id)
+    except httpx.HTTPError as e:
+        logger.warning("⚠️  Status stream for task %s failed: %s", task_id, e)
+
+    return None
+
+class FailureMessage(str):
+    """A reply reporting that a generation did not produce a presentation."""
+
+def _failure_reason(status: TaskStatus) -> str:
+    """The error message a failed task reported, if any."""
+    task_result = status.task_result
+    return task_result.get("error", "Unknown error") if isinstance(task_result, dict) else "Unknown error"
+
+def _task_outcome(task_id: str, status: TaskStatus, success_label: str, job_label: str) -> str:
+    """Formats the message for a task that finished with SUCCESS or FAILED."""
+    task_result = status.task_result
+    if status.task_status == TASK_SUCCESS:
+        logger.info(f"🎉 Task {task_id} completed successfully!")
+        final_result = task_result or status.envelope
+        if not isinstance(final_result, str):
+            # Valid JSON rather than a Python repr, so the client can parse it
+            final_result = _json_dumps(final_result, indent=True)
+        return f"✅ {success_label} generated successfully!\n\n{final_result}\n\nMake sure to return the PPTX URL to the user if available."
+
+    logger.error(f"❌ Task {task_id} failed. Response: {status.envelope}")
+    return FailureMessage(f"❌ {job_label} generation failed for task {task_id}.\nReason: {_failure_reason(status)}")
+
+def _poll_delay(attempt: int) -> float:
+    """
+    Delay before the next status check: short at first, settling around POLL_DELAYS[-1].
+
+    Jittered so pollers started together (e.g. by batch_generate) drift apart
+    instead of hitting the API in lockstep.
+    """
+    delay = POLL_DELAYS[min(attempt, len(POLL_DELAYS) - 1)]
+    return delay * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+# Wake-up events for tasks being polled right now. Setting one ends that poller's
+# current sleep, e.g. when get_task_status has already seen the task finish.
+# Pollers hold the only strong reference, so entries vanish when they return.
+_poll_wakeups: weakref.WeakValueDictionary[str, asyncio.Event] = weakref.WeakValueDictionary()
+
+def _wake_poller(task_id: str) -> None:
+    """Makes any poller waiting on task_id check its status immediately."""
+    wakeup = _poll_wakeups.get(task_id)
+    if wakeup is not None:
+        wakeup.set()
+
+async def _poll_until_done(
+    task_id: str,
+    success_label: str,
+    job_label: str,
+    deadline: Optional[float] = None
+) -> str:
+    """
+    Waits for a task to reach SUCCESS or FAILED, with no deadline of its own.
+
+    Uses the streaming status endpoint when the API offers it and falls back
+    to polling /task_status otherwise. Callers bound it with asyncio.wait_for;
+    passing the same deadline here only shortens the last sleep so one final
+    check lands just before it, instead of the wait expiring mid-sleep.
+    """
+    streamed = await _stream_task_status(task_id)
+    if streamed is not None:
+        return _task_outcome(task_id, streamed, success_label, job_label)
+
+    status_endpoint = f"/task_status/{task_id}"
+    wakeup = _poll_wakeups.setdefault(task_id, asyncio.Event())
+    poll_count = 0
+    consecutive_failures = 0
+    last_status = None
+
+    while True:
+        poll_count += 1
+        logger.debug("🔄 Polling status for task %s (attempt %d)...", task_id, poll_count)
+        result = await _send_api_request("GET", status_endpoint, timeout=POLLING_TIMEOUT)
+        raw = result.content
+
+        # Intermediate polls only need the status; skip the full parse for them
+        pending_status = _scan_pending_status(raw) if raw is not None else None
+        if pending_status is not None:
+            status = TaskStatus(pending_status)
+        elif result.status in TASK_NOT_READY_STATUS_CODES:
+            # The task id came from the generation response, so it exists but isn't visible yet
+            status = TaskStatus("PENDING")
+        else:
+            status = _parse_status(_parse_response("GET", status_endpoint, raw)) if raw is not None else None
+
+        if status is not None:
+            consecutive_failures = 0
+            task_status = status.task_status
+
+            # Only status transitions are worth an INFO line; repeats go to DEBUG
+            if task_status != last_status:
+                logger.info("📊 Task status: %s", task_status)
+                last_status = task_status
+            else:
+                logger.debug("📊 Task status: %s", task_status)
+
+            if task_status in TASK_TERMINAL_STATES:
+                return _task_outcome(task_id, status, success_label, job_label)
+            elif task_status in TASK_PENDING_STATES:
+                logger.debug("⏳ Task %s status: %s. Waiting...", task_id, task_status)
+            else:
+                logger.warning("⚠️  Task %s has unknown status: %s", task_id, task_status)
+        else:
+            consecutive_failures += 1
+            if consecutive_failures >= POLL_MAX_FAILURES:
+                logger.error("❌ Giving up on task %s after %d failed status checks", task_id, consecutive_failures)
+                return FailureMessage(f"❌ Could not get the status of task {task_id} after {consecutive_failures} attempts.\nThe task might still be running. You can check status using get_task_status.")
+
+            if result.retry_after is not None:
+                # Rate limited or unavailable: wait exactly as long as the API asked
+                delay = result.retry_after
+            else:
+                # Full-jitter exponential backoff so concurrent pollers don't retry in lockstep
+                delay = random.uniform(0, min(POLL_FAILURE_BACKOFF_MAX, 0.5 * 2 ** (consecutive_failures - 1)))
+            logger.warning("⚠️  Failed to get status for task %s during polling. Retrying in %.2fs.", task_id, delay)
+            await asyncio.sleep(delay)
+            continue
+
+        delay = _poll_delay(poll_count - 1)
+        if deadline is not None:
+            remaining = deadline - time.monotonic() - POLL_DEADLINE_MARGIN
+            if remaining > 0:
+                delay = min(delay, remaining)
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=delay)
+            logger.debug("⏰ Poller for task %s woken early", task_id)
+            wakeup.clear()
+        except asyncio.TimeoutError:
+            pass
+
+async def _await_task(
+    task_id: str,
+    success_label: str,
+    job_label: str,
+    deadline: Optional[float] = None
+) -> str:
+    """
+    Waits for a task to finish or for its deadline to pass.
+
+    The deadline is enforced by asyncio.wait_for, which also cancels any
+    in-flight status request when it expires. The status is always read at
+    least once before a timeout is reported, even if the deadline has passed.
+
+    Args:
+        task_id: The task ID returned by a generation endpoint.
+        success_label: What was generated, used in the success message (e.g. 'Presentation').
+        job_label: The kind of generation, used in failure and timeout messages (e.g. 'PowerPoint').
+        deadline: time.monotonic() value to give up at. Defaults to GENERATION_TIMEOUT from now.
 
-# --- Health Check ---
-# Note: FastMCP resources don't create HTTP endpoints, they're MCP protocol resources
-# For Railway health checks, we need to use a different approach
+    Returns:
+        A message describing the result, failure reason, or timeout.
+    """
+    start_time = time.monotonic()
+    if deadline is None:
+        deadline = start_time + GENERATION_TIMEOUT
+    try:
+        return await asyncio.wait_for(
+            _poll_until_done(task_id, success_label, job_label, deadline),
+            timeout=max(deadline - start_time, 0.0)
+        )
+    except asyncio.TimeoutError:
+        # One last check, so a task that finished during the POST or the final
+        # sleep isn't reported as a timeout without its status ever being read
+        status = _parse_status(await _make_api_request("GET", f"/task_status/{task_id}", timeout=POLLING_TIMEOUT))
+        if status is not None and status.task_status in TASK_TERMINAL_STATES:
+            return _task_outcome(task_id, status, success_label, job_label)
+
+        elapsed = time.monotonic() - start_time
+        logger.warning(f"⏱️  Timeout after {elapsed:.1f}s while waiting for task {task_id}")
+        return FailureMessage(f"⏱️  Timeout while waiting for {job_label} generation (Task ID: {task_id}).\nThe task might still be running. You can check status using get_task_status.")
+
+# Static part of the health report, built once at import
+_HEALTH_STATUS = {
+    "status": "healthy",
+    "service": "SlideSpeak MCP Server",
+    "version": "1.0.0",
+    "api_configured": API_KEY is not None,
+    "api_base": API_BASE,
+    "endpoints": {
+        "templates": "/presentation/templates",
+        "generate": "/presentation/generate",
+        "slide_by_slide": "/presentation/generate/slide-by-slide",
+        "task_status": "/task_status/{task_id}",
+        "me": "/me",
+        "upload": "/document/upload"
+    }
+}
+
+# The health report is static apart from its trailing timestamp, so serialize the
+# rest once and splice the timestamp in (ISO timestamps need no JSON escaping)
+_HEALTH_JSON_PREFIX = _json_dumps(_HEALTH_STATUS, indent=True)[:-2] + ',\n  "timestamp": "'
+_HEALTH_JSON_SUFFIX = '"\n}'
+
+# (unix second, ISO timestamp) last reported, so bursts of checks format it once
+_health_timestamp: tuple[int, str] = (0, "")
+
+def _health_now() -> str:
+    """The current UTC time as an ISO timestamp, at one-second resolution."""
+    global _health_timestamp
+    now = int(time.time())
+    if now != _health_timestamp[0]:
+        _health_timestamp = (now, datetime.fromtimestamp(now, tz=timezone.utc).isoformat())
+    return _health_timestamp[1]
 
-# Create a simple health check tool that Railway can call via the MCP endpoint
 @mcp.tool()
 async def health_check() -> str:
     """Health check endpoint for monitoring"""
-    status = {
-        "status": "healthy",
-        "service": "SlideSpeak MCP Server",
-        "version": "1.0.0",
-        "api_configured": API_KEY is not None,
-        "api_base": API_BASE,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "endpoints": {
-            "templates": "/presentation/templates",
-            "generate": "/presentation/generate",
-            "slide_by_slide": "/presentation/generate/slide-by-slide",
-            "task_status": "/task_status/{task_id}",
-            "me": "/me",
-            "upload": "/document/upload"
-        }
-    }
-    logger.info("🏥 Health check requested")
-    return json.dumps(status, indent=2)
+    logger.debug("🏥 Health check requested")
+    return _HEALTH_JSON_PREFIX + _health_now() + _HEALTH_JSON_SUFFIX
 
 # --- MCP Tools ---
 
+# (fetched_at, formatted reply) per catalog endpoint, from its last successful fetch.
+# The per-endpoint locks make concurrent cold calls share a single upstream request.
+_catalog_cache: dict[str, tuple[float, str]] = {}
+_catalog_locks: dict[str, asyncio.Lock] = {}
+
+def _cached_text(endpoint: str) -> Optional[str]:
+    """Returns the cached reply for endpoint if it is younger than CATALOG_TTL."""
+    entry = _catalog_cache.get(endpoint)
+    if entry and time.monotonic() - entry[0] < CATALOG_TTL:
+        return entry[1]
+    return None
+
+async def _cached_catalog(endpoint: str, render: Callable[[Any], tuple[str, bool]]) -> Optional[str]:
+    """
+    Fetches a catalog endpoint and formats it, reusing the reply for CATALOG_TTL seconds.
+
+    Args:
+        endpoint: API endpoint to GET (e.g., '/presentation/templates').
+        render: Formats the decoded response; returns the reply and whether it may be cached.
+
+    Returns:
+        The formatted reply, or None if the fetch failed.
+    """
+    cached = _cached_text(endpoint)
+    if cached is not None:
+        logger.info("✅ Returning cached %s", endpoint)
+        return cached
+
+    async with _catalog_locks.setdefault(endpoint, asyncio.Lock()):
+        # Another call may have refreshed the cache while we waited for the lock
+        cached = _cached_text(endpoint)
+        if cached is not None:
+            logger.info("✅ Returning cached %s", endpoint)
+            return cached
+
+        data = await _make_api_request("GET", endpoint)
+        if not data:
+            logger.error("❌ Failed to fetch %s", endpoint)
+            return None
+
+        text, cacheable = render(data)
+        if cacheable:
+            _catalog_cache[endpoint] = (time.monotonic(), text)
+        return text
+
+# Placeholders for templates the API lists without preview images
+_NO_COVER_IMAGE = "No cover image URL"
+_NO_CONTENT_IMAGE = "No content image URL"
+
+def _render_templates(templates_data: Any) -> tuple[str, bool]:
+    """Formats the /presentation/templates response."""
+    if not isinstance(templates_data, list):
+        logger.warning("⚠️  Unexpected response format for templates: %s", type(templates_data).__name__)
+        return f"Unexpected response format received for templates: {type(templates_data).__name__}", False
+
+    parts = ["Available templates:\n"]
+    for template in templates_data:
+        # Add more robust checking for expected keys
+        name = template.get("name", "default")
+        images = template.get("images", {})
+        cover = images.get("cover", _NO_COVER_IMAGE)
+        content = images.get("content", _NO_CONTENT_IMAGE)
+        parts.append(f"- {name}\n  Cover: {cover}\n  Content: {content}\n\n")
+        logger.debug("📋 Template %d: %s", len(parts) - 1, name)
+
+    logger.info("✅ Successfully fetched %d templates", len(templates_data))
+    return "".join(parts).rstrip(), True
+
+def _render_themes(themes_data: Any) -> tuple[str, bool]:
+    """Formats the /presentation/themes response."""
+    if not isinstance(themes_data, list):
+        return f"Themes data: {themes_data}", False
+
+    parts = ["Available themes:\n"]
+    for theme in themes_data:
+        if isinstance(theme, dict):
+            name = theme.get("name", "unknown")
+            theme_id = theme.get("id", "")
+            description = theme.get("description", "")
+            parts.append(f"- {name}")
+            if theme_id:
+                parts.append(f" (ID: {theme_id})")
+            if description:
+                parts.append(f"\n  Description: {description}")
+            parts.append("\n")
+        else:
+            parts.append(f"- {theme}\n")
+    return "".join(parts).rstrip(), True
+
 @mcp.tool()
 async def get_available_templates() -> str:
     """
@@ -169,40 +753,15 @@ async def get_available_templates() -> str:
     This is typically the first command to run to see what templates are available.
     """
     logger.info("🎨 Fetching available templates")
-    templates_endpoint = "/presentation/templates"
 
     if not API_KEY:
         logger.error("❌ API Key missing for get_available_templates")
         return "API Key is missing. Cannot process any requests."
 
-    templates_data = await _make_api_request("GET", templates_endpoint)
-
-    if not templates_data:
-        logger.error("❌ Failed to fetch templates")
+    result = await _cached_catalog("/presentation/templates", _render_templates)
+    if result is None:
         return "Unable to fetch templates due to an API error. Check server logs."
-
-    if not isinstance(templates_data, list):
-        logger.warning(f"⚠️  Unexpected response format for templates: {type(templates_data).__name__}")
-        return f"Unexpected response format received for templates: {type(templates_data).__name__}"
-
-    if not templates_data:
-        logger.info("ℹ️  No templates available")
-        return "No templates available."
-
-    formatted_templates = "Available templates:\n"
-    template_count = 0
-    for template in templates_data:
-        template_count += 1
-        # Add more robust checking for expected keys
-        name = template.get("name", "default")
-        images = template.get("images", {})
-        cover = images.get("cover", "No cover image URL")
-        content = images.get("content", "No content image URL")
-        formatted_templates += f"- {name}\n  Cover: {cover}\n  Content: {content}\n\n"
-        logger.debug(f"📋 Template {template_count}: {name}")
-
-    logger.info(f"✅ Successfully fetched {template_count} templates")
-    return formatted_templates.strip()
+    return result
 
 @mcp.tool()
 async def get_me() -> str:
@@ -227,7 +786,7 @@ async def get_me() -> str:
     if 'credits' in result:
         logger.info(f"💳 Credits remaining: {result.get('credits', 'Unknown')}")
     
-    return json.dumps(result, indent=2) + "\n\nNote: Generating slides costs 1 credit per slide"
+    return _json_dumps(result, indent=True) + "\n\nNote: Generating slides costs 1 credit per slide"
 
 @mcp.tool()
 async def get_themes() -> str:
@@ -237,34 +796,149 @@ async def get_themes() -> str:
     This endpoint returns all available themes that can be used in the template parameter
     when generating presentations. Use this to see what themes are available.
     """
-    themes_endpoint = "/presentation/themes"
-
     if not API_KEY:
         return "API Key is missing. Cannot process any requests."
 
-    themes_data = await _make_api_request("GET", themes_endpoint)
-
-    if not themes_data:
+    result = await _cached_catalog("/presentation/themes", _render_themes)
+    if result is None:
         return "Unable to fetch themes due to an API error. Check server logs."
+    return result
 
-    if isinstance(themes_data, list):
-        formatted_themes = "Available themes:\n"
-        for theme in themes_data:
-            if isinstance(theme, dict):
-                name = theme.get("name", "unknown")
-                theme_id = theme.get("id", "")
-                description = theme.get("description", "")
-                formatted_themes += f"- {name}"
-                if theme_id:
-                    formatted_themes += f" (ID: {theme_id})"
-                if description:
-                    formatted_themes += f"\n  Description: {description}"
-                formatted_themes += "\n"
-            else:
-                formatted_themes += f"- {theme}\n"
-        return formatted_themes.strip()
+async def _generate_and_poll(
+    endpoint: str,
+    payload: dict[str, Any] | bytes,
+    success_label: str,
+    job_label: str,
+    on_task_id: Optional[Callable[[str], None]] = None
+) -> str:
+    """
+    Starts a generation task and waits for its result.
+
+    Args:
+        endpoint: Generation endpoint to POST the payload to.
+        payload: JSON body for the generation request, as a dict or encoded bytes.
+        success_label: What was generated, used in the success message.
+        job_label: Kind of generation, used in log and error messages.
+        on_task_id: Called with the task ID as soon as the API returns one.
+
+    Returns:
+        The formatted task outcome, or an error message.
+    """
+    # Step 1: Initiate generation (POST request). It keeps its own timeout rather
+    # than sharing the polling deadline: cutting it short could lose the task ID
+    # of a generation the API has already accepted.
+    logger.info(f"🚀 Initiating {job_label} generation...")
+    init_result = await _make_api_request("POST", endpoint, payload=payload, timeout=GENERATION_TIMEOUT)
+
+    if not init_result:
+        logger.error(f"❌ Failed to initiate {job_label} generation")
+        return FailureMessage(f"Failed to initiate {job_label} generation due to an API error. Check server logs.")
+
+    task_id = init_result.get("task_id")
+    if not task_id:
+        logger.error(f"❌ No task ID in response: {init_result}")
+        return FailureMessage(f"Failed to initiate {job_label} generation. API response did not contain a task ID. Response: {init_result}")
+
+    logger.info(f"✅ {job_label} generation initiated. Task ID: {task_id}")
+    if on_task_id is not None:
+        on_task_id(task_id)
+
+    # Step 2: Poll for the task status for up to GENERATION_TIMEOUT from now
+    return await _await_task(task_id, success_label, job_label)
+
+@dataclass(slots=True)
+class InflightGeneration:
+    """A running generation that identical concurrent calls wait on."""
+    future: asyncio.Future[str]
+    task_id: Optional[str] = None  # Set once the generation request has returned one
+
+# Identical generation requests currently running, keyed by a hash of their payload.
+# Concurrent callers with the same payload share one upstream generation.
+_inflight_generations: dict[str, InflightGeneration] = {}
+
+async def _generate_powerpoint(
+    plain_text: str,
+    length: int,
+    template: str,
+    document_uuids: Optional[list[str]] = None,
+    language: Optional[str] = "ORIGINAL",
+    fetch_images: Optional[bool] = True,
+    tone: Optional[str] = "default",
+    verbosity: Optional[str] = "standard",
+    custom_user_instructions: Optional[str] = None
+) -> str:
+    """
+    Starts a /presentation/generate task and waits for its result.
+
+    Shared by the generate_powerpoint and batch_generate tools; takes the same
+    arguments as generate_powerpoint.
+    """
+    logger.info("🎯 Starting PowerPoint generation")
+    logger.info(f"📝 Text length: {len(plain_text)} chars")
+    logger.info(f"📊 Slides requested: {length}")
+    logger.info(f"🎨 Template: {template}")
+
+    if not API_KEY:
+        logger.error("❌ API Key missing for generate_powerpoint")
+        return FailureMessage("API Key is missing. Cannot process any requests.")
+
+    if not isinstance(length, int) or isinstance(length, bool) or length < 1:
+        logger.error(f"❌ Invalid slide count: {length!r}")
+        return FailureMessage(f"Parameter 'length' must be a positive number of slides, got {length!r}.")
+
+    # Prepare the JSON body for the generation request
+    payload: dict[str, Any] = {
+        "plain_text": plain_text,
+        "length": length,
+        "template": template
+    }
+    if document_uuids:
+        payload["document_uuids"] = document_uuids
+        logger.info(f"📎 Including {len(document_uuids)} document(s)")
+
+    # Encode once: the same bytes key the in-flight lookup and become the request body
+    body = _json_bytes(payload, sort_keys=True)
+    key = hashlib.blake2b(body, digest_size=16).hexdigest()
+    while (existing := _inflight_generations.get(key)) is not None:
+        logger.info("🔁 Identical generation already in progress, waiting for its result")
+        try:
+            return await asyncio.shield(existing.future)
+        except asyncio.CancelledError:
+            # Re-raise if we were cancelled ourselves, even in the same tick as the
+            # leader; only a cancelled leader with a live follower falls through
+            current = asyncio.current_task()
+            if not existing.future.cancelled() or (current is not None and current.cancelling()):
+                raise
+            if existing.task_id is not None:
+                # The upstream task keeps running without its caller; follow it
+                # rather than paying for a second generation
+                logger.info(f"🔁 Original caller went away; resuming task {existing.task_id}")
+                return await _await_task(existing.task_id, "Presentation", "PowerPoint")
+            # It went away before the API accepted the generation; run it ourselves
+
+    future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    inflight = InflightGeneration(future)
+    _inflight_generations[key] = inflight
+
+    def publish_task_id(task_id: str) -> None:
+        inflight.task_id = task_id
+
+    try:
+        result = await _generate_and_poll(
+            "/presentation/generate", body, "Presentation", "PowerPoint", on_task_id=publish_task_id
+        )
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Marks it retrieved when nobody else was waiting
+        raise
     else:
-        return f"Themes data: {themes_data}"
+        future.set_result(result)
+        return result
+    finally:
+        _inflight_generations.pop(key, None)
 
 @mcp.tool()
 async def generate_powerpoint(
@@ -293,87 +967,136 @@ async def generate_powerpoint(
     Returns:
         URL to download the generated PPTX file or error message
     """
-    logger.info("🎯 Starting PowerPoint generation")
-    logger.info(f"📝 Text length: {len(plain_text)} chars")
-    logger.info(f"📊 Slides requested: {length}")
-    logger.info(f"🎨 Template: {template}")
-    
-    generation_endpoint = "/presentation/generate"
-    status_endpoint_base = "/task_status"
+    return await _generate_powerpoint(
+        plain_text=plain_text,
+        length=length,
+        template=template,
+        document_uuids=document_uuids,
+        language=language,
+        fetch_images=fetch_images,
+        tone=tone,
+        verbosity=verbosity,
+        custom_user_instructions=custom_user_instructions,
+    )
 
-    if not API_KEY:
-        logger.error("❌ API Key missing for generate_powerpoint")
-        return "API Key is missing. Cannot process any requests."
+async def _generate_slide_by_slide(payload: dict[str, Any], success_label: str = "Slide-by-slide presentation") -> str:
+    """Starts a slide-by-slide generation task and waits for its result."""
+    return await _generate_and_poll("/presentation/generate/slide-by-slide", payload, success_label, "Slide-by-slide")
 
-    # Prepare the JSON body for the generation request
-    payload: dict[str, Any] = {
-        "plain_text": plain_text,
-        "length": length,
-        "template": template
-    }
-    if document_uuids:
-        payload["document_uuids"] = document_uuids
-        logger.info(f"📎 Including {len(document_uuids)} document(s)")
+async def _generate_slide_chunks(payload: dict[str, Any], chunk_size: int) -> str:
+    """
+    Generates the slides as separate presentations of at most chunk_size slides.
 
-    # Step 1: Initiate generation (POST request)
-    logger.info("🚀 Initiating PowerPoint generation...")
-    init_result = await _make_api_request("POST", generation_endpoint, payload=payload, timeout=GENERATION_TIMEOUT)
+    All parts are started and polled concurrently, so the total wait is about
+    that of the slowest part. Results are returned in slide order.
+    """
+    slides = payload["slides"]
+    starts = range(0, len(slides), chunk_size)
+    logger.info(f"🧩 Splitting {len(slides)} slides into {len(starts)} parts of up to {chunk_size}")
+
+    results = await asyncio.gather(*[
+        _generate_slide_by_slide(
+            {**payload, "slides": slides[start:start + chunk_size]},
+            success_label=f"Part {index}/{len(starts)} (slides {start + 1}-{min(start + chunk_size, len(slides))})"
+        )
+        for index, start in enumerate(starts, 1)
+    ])
+    joined = "\n\n".join(results)
+    # One failed part means the deck is incomplete
+    return FailureMessage(joined) if any(isinstance(part, FailureMessage) for part in results) else joined
+
+def _validate_slides(slides: list[Any]) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """
+    Checks each slide's layout and item_amount against _LAYOUT_CONSTRAINTS.
 
-    if not init_result:
-        logger.error("❌ Failed to initiate generation")
-        return "Failed to initiate PowerPoint generation due to an API error. Check server logs."
+    The same pass copies each slide with only the _SLIDE_FIELDS it sets, so
+    extra keys from the caller aren't encoded and sent.
 
-    task_id = init_result.get("task_id")
-    if not task_id:
-        logger.error(f"❌ No task ID in response: {init_result}")
-        return f"Failed to initiate PowerPoint generation. API response did not contain a task ID. Response: {init_result}"
+    Args:
+        slides: Slide definitions as passed to generate_slide_by_slide.
+
+    Returns:
+        The trimmed slides and None, or an empty list and an error message
+        for the first invalid slide.
+    """
+    slim: list[dict[str, Any]] = []
+    for i, slide in enumerate(slides, 1):
+        if not isinstance(slide, dict):
+            logger.error("❌ Slide %d is not an object", i)
+            return [], f"Slide {i} must be an object with title, layout, item_amount and content."
+
+        layout = slide.get("layout")
+        logger.debug("Slide %d: %s - Layout: %s", i, slide.get('title', 'Untitled'), layout or 'Unknown')
+
+        limits = _LAYOUT_CONSTRAINTS.get(layout) if isinstance(layout, str) else None
+        if limits is None:
+            logger.error("❌ Slide %d has unknown layout %r", i, layout)
+            return [], f"Slide {i} ('{slide.get('title', 'Untitled')}'): unknown layout {layout!r}. Available layouts: {', '.join(_LAYOUT_CONSTRAINTS)}."
+
+        item_amount = slide.get("item_amount")
+        if item_amount is not None:
+            low, high = limits
+            if not isinstance(item_amount, int) or isinstance(item_amount, bool) or not low <= item_amount <= high:
+                expected = f"exactly {low}" if low == high else f"{low}-{high}"
+                logger.error("❌ Slide %d has item_amount %r for layout '%s'", i, item_amount, layout)
+                return [], f"Slide {i} ('{slide.get('title', 'Untitled')}'): layout '{layout}' takes {expected} item(s), got item_amount={item_amount!r}."
+
+        slim.append({key: slide[key] for key in _SLIDE_FIELDS if key in slide})
+
+    return slim, None
+
+async def _generate_slides(
+    template: str,
+    slides: list[dict[str, Any]],
+    language: Optional[str] = None,
+    fetch_images: Optional[bool] = True,
+    include_cover: Optional[bool] = True,
+    include_table_of_contents: Optional[bool] = False,
+    chunk_size: Optional[int] = None,
+) -> str:
+    """
+    Validates slide definitions, then generates them slide by slide.
 
-    logger.info(f"✅ PowerPoint generation initiated. Task ID: {task_id}")
+    Shared by the generate_slide_by_slide and batch_generate tools; takes the
+    same arguments as generate_slide_by_slide.
+    """
+    logger.info("🎯 Starting slide-by-slide generation")
+    logger.info(f"📊 Number of slides: {len(slides)}")
+    logger.info(f"🎨 Template: {template}")
+    if language:
+        logger.info(f"🌍 Language: {language}")
 
-    # Step 2: Poll for the task status
-    status_endpoint = f"{status_endpoint_base}/{task_id}"
-    start_time = time.time()
-    final_result = None
-    poll_count = 0
+    if not API_KEY:
+        logger.error("❌ API Key missing for generate_slide_by_slide")
+        return FailureMessage("API Key is missing. Cannot process any requests.")
 
-    while time.time() - start_time < GENERATION_TIMEOUT:
-        poll_count += 1
-        logger.debug(f"🔄 Polling status for task {task_id} (attempt {poll_count})...")
-        status_result = await _make_api_request("GET", status_endpoint, timeout=POLLING_TIMEOUT)
+    # Basic validation
+    if not isinstance(slides, list) or len(slides) == 0:
+        logger.error("❌ Invalid slides parameter")
+        return FailureMessage("Parameter 'slides' must be a non-empty list of slide objects.")
 
-        if status_result:
-            task_status = status_result.get("task_status")
-            task_result = status_result.get("task_result")
-            
-            logger.info(f"📊 Task status: {task_status}")
-
-            if task_status == "SUCCESS":
-                logger.info(f"🎉 Task {task_id} completed successfully!")
-                final_result = str(task_result) if task_result else str(status_result)
-                final_result = f"✅ Presentation generated successfully!\n\n{final_result}\n\nMake sure to return the PPTX URL to the user if available."
-                break
-            elif task_status == "FAILED":
-                logger.error(f"❌ Task {task_id} failed. Response: {status_result}")
-                error_message = task_result.get("error", "Unknown error") if isinstance(task_result, dict) else "Unknown error"
-                final_result = f"❌ PowerPoint generation failed for task {task_id}.\nReason: {error_message}"
-                break
-            elif task_status in ["PENDING", "PROCESSING", "SENT"]:
-                logger.debug(f"⏳ Task {task_id} status: {task_status}. Waiting...")
-            else:
-                logger.warning(f"⚠️  Task {task_id} has unknown status: {task_status}")
+    if chunk_size is not None and chunk_size < 1:
+        logger.error("❌ Invalid chunk_size parameter")
+        return FailureMessage("Parameter 'chunk_size' must be at least 1.")
 
-        else:
-            logger.warning(f"⚠️  Failed to get status for task {task_id} during polling. Will retry.")
+    # Check layouts and item counts before spending a generation on them
+    slides, error = _validate_slides(slides)
+    if error:
+        return FailureMessage(error)
+
+    payload: dict[str, Any] = {
+        "template": template,
+        "slides": slides,
+    }
+    if language:
+        payload["language"] = language
+    if fetch_images is not None:
+        payload["fetch_images"] = fetch_images
 
-        await asyncio.sleep(POLLING_INTERVAL)
+    if chunk_size and len(slides) > chunk_size:
+        return await _generate_slide_chunks(payload, chunk_size)
 
-    # After loop: check if we got a result or timed out
-    if final_result:
-        return final_result
-    else:
-        elapsed = time.time() - start_time
-        logger.warning(f"⏱️  Timeout after {elapsed:.1f}s while waiting for task {task_id}")
-        return f"⏱️  Timeout while waiting for PowerPoint generation (Task ID: {task_id}).\nThe task might still be running. You can check status using get_task_status."
+    return await _generate_slide_by_slide(payload)
 
 @mcp.tool()
 async def generate_slide_by_slide(
@@ -383,11 +1106,15 @@ async def generate_slide_by_slide(
     fetch_images: Optional[bool] = Field(default=True, description="Whether to fetch images for slides"),
     include_cover: Optional[bool] = Field(default=True, description="Whether to include a cover slide"),
     include_table_of_contents: Optional[bool] = Field(default=False, description="Whether to include table of contents slides"),
+    chunk_size: Optional[int] = Field(default=None, description="Optional: split the slides into separate presentations of this many slides, generated in parallel"),
 ) -> str:
     """
     Generate a PowerPoint presentation using Slide-by-Slide input for precise control.
 
     This gives you complete control over each slide's content and layout.
+    For long decks, set chunk_size to generate the slides as several smaller
+    presentations in parallel; each part is returned with its own PPTX URL,
+    in slide order.
 
     Parameters:
         template: The name of the template or custom template ID
@@ -397,6 +1124,7 @@ async def generate_slide_by_slide(
             - layout: Layout type (see available layouts below)
             - item_amount: Number of items (must match layout constraints)
             - content: The slide content
+        chunk_size: Optional number of slides per generated part
 
     Available Layouts:
         - items: 1-5 items
@@ -417,94 +1145,93 @@ async def generate_slide_by_slide(
     Returns:
         URL to download the generated PPTX file or error message
     """
-    logger.info("🎯 Starting slide-by-slide generation")
-    logger.info(f"📊 Number of slides: {len(slides)}")
-    logger.info(f"🎨 Template: {template}")
-    if language:
-        logger.info(f"🌍 Language: {language}")
-    
-    endpoint = "/presentation/generate/slide-by-slide"
-    status_endpoint_base = "/task_status"
+    return await _generate_slides(
+        template=template,
+        slides=slides,
+        language=language,
+        fetch_images=fetch_images,
+        include_cover=include_cover,
+        include_table_of_contents=include_table_of_contents,
+        chunk_size=chunk_size,
+    )
 
-    if not API_KEY:
-        logger.error("❌ API Key missing for generate_slide_by_slide")
-        return "API Key is missing. Cannot process any requests."
+class BatchJobFailed(Exception):
+    """Raised for a batch job whose generation returned a FailureMessage."""
 
-    # Basic validation
-    if not isinstance(slides, list) or len(slides) == 0:
-        logger.error("❌ Invalid slides parameter")
-        return "Parameter 'slides' must be a non-empty list of slide objects."
+@mcp.tool()
+async def batch_generate(
+    jobs: list[dict[str, Any]] = Field(description="List of job objects: generate_powerpoint arguments (plain_text, length, template, ...), or generate_slide_by_slide arguments (template, slides, ...) for slide-by-slide jobs"),
+    max_concurrent: int = Field(default=4, description="Maximum number of presentations generated at the same time"),
+    stop_on_error: bool = Field(default=False, description="Cancel the remaining jobs as soon as one job fails (invalid arguments, API error, failed task or timeout)")
+) -> str:
+    """
+    Generate several PowerPoint presentations concurrently.
 
-    # Log slide details
-    for i, slide in enumerate(slides, 1):
-        logger.debug(f"Slide {i}: {slide.get('title', 'Untitled')} - Layout: {slide.get('layout', 'Unknown')}")
+    Each job takes the same arguments as generate_powerpoint, or those of
+    generate_slide_by_slide when it has a "slides" entry. Jobs run in
+    parallel (up to max_concurrent at once), so the total wait is roughly that
+    of the slowest job rather than the sum of all of them.
 
-    payload: dict[str, Any] = {
-        "template": template,
-        "slides": slides,
-    }
-    if language:
-        payload["language"] = language
-    if fetch_images is not None:
-        payload["fetch_images"] = fetch_images
-
-    # Step 1: Initiate slide-by-slide generation
-    logger.info("🚀 Initiating slide-by-slide generation...")
-    init_result = await _make_api_request("POST", endpoint, payload=payload, timeout=GENERATION_TIMEOUT)
-    
-    if not init_result:
-        logger.error("❌ Failed to initiate slide-by-slide generation")
-        return "Failed to initiate slide-by-slide generation due to an API error. Check server logs."
+    Args:
+        jobs: List of generate_powerpoint or generate_slide_by_slide argument dictionaries
+        max_concurrent: Maximum number of generations in flight
+        stop_on_error: Cancel pending jobs after the first failed job
 
-    task_id = init_result.get("task_id")
-    if not task_id:
-        logger.error(f"❌ No task ID in response: {init_result}")
-        return f"Failed to initiate slide-by-slide generation. API response did not contain a task ID. Response: {init_result}"
+    Returns:
+        JSON list pairing each job with its result message
+    """
+    logger.info(f"📦 Starting batch generation of {len(jobs)} presentation(s)")
 
-    logger.info(f"✅ Slide-by-slide generation initiated. Task ID: {task_id}")
+    if not API_KEY:
+        logger.error("❌ API Key missing for batch_generate")
+        return "API Key is missing. Cannot process any requests."
 
-    # Step 2: Poll for the task status
-    status_endpoint = f"{status_endpoint_base}/{task_id}"
-    start_time = time.time()
-    final_result: Optional[str] = None
-    poll_count = 0
+    if not isinstance(jobs, list) or len(jobs) == 0:
+        logger.error("❌ Invalid jobs parameter")
+        return "Parameter 'jobs' must be a non-empty list of job objects."
 
-    while time.time() - start_time < GENERATION_TIMEOUT:
-        poll_count += 1
-        logger.debug(f"🔄 Polling status for task {task_id} (attempt {poll_count})...")
-        status_result = await _make_api_request("GET", status_endpoint, timeout=POLLING_TIMEOUT)
+    if max_concurrent < 1:
+        return "Parameter 'max_concurrent' must be at least 1."
 
-        if status_result:
-            task_status = status_result.get("task_status")
-            task_result = status_result.get("task_result")
-            
-            logger.info(f"📊 Task status: {task_status}")
-
-            if task_status == "SUCCESS":
-                logger.info(f"🎉 Task {task_id} completed successfully!")
-                final_result = str(task_result) if task_result else str(status_result)
-                final_result = f"✅ Slide-by-slide presentation generated successfully!\n\n{final_result}\n\nMake sure to return the PPTX URL to the user if available."
-                break
-            elif task_status == "FAILED":
-                logger.error(f"❌ Task {task_id} failed. Response: {status_result}")
-                error_message = task_result.get("error", "Unknown error") if isinstance(task_result, dict) else "Unknown error"
-                final_result = f"❌ Slide-by-slide generation failed for task {task_id}.\nReason: {error_message}"
-                break
-            elif task_status in ("PENDING", "PROCESSING", "SENT"):
-                logger.debug(f"⏳ Task {task_id} status: {task_status}. Waiting...")
-            else:
-                logger.warning(f"⚠️  Task {task_id} has unknown status: {task_status}")
-        else:
-            logger.warning(f"⚠️  Failed to get status for task {task_id} during polling. Will retry.")
+    semaphore = asyncio.Semaphore(max_concurrent)
 
-        await asyncio.sleep(POLLING_INTERVAL)
+    async def run(job: dict[str, Any]) -> str:
+        generate = _generate_slides if "slides" in job else _generate_powerpoint
+        async with semaphore:
+            result = await generate(**job)
+        if isinstance(result, FailureMessage):
+            raise BatchJobFailed(result)  # Lets the TaskGroup cancel the other jobs
+        return result
 
-    if final_result:
-        return final_result
+    if stop_on_error:
+        # The TaskGroup cancels the remaining jobs on the first error, and all of
+        # them if this tool call is itself cancelled
+        tasks: list[asyncio.Task[str]] = []
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(run(job)) for job in jobs]
+        except* Exception:
+            pass  # Reported per job below
+        results = [
+            asyncio.CancelledError() if task.cancelled() else task.exception() or task.result()
+            for task in tasks
+        ]
     else:
-        elapsed = time.time() - start_time
-        logger.warning(f"⏱️  Timeout after {elapsed:.1f}s while waiting for task {task_id}")
-        return f"⏱️  Timeout while waiting for slide-by-slide generation (Task ID: {task_id}).\nThe task might still be running. You can check status using get_task_status."
+        results = await asyncio.gather(*[run(job) for job in jobs], return_exceptions=True)
+
+    summary = []
+    for job, result in zip(jobs, results):
+        if isinstance(result, BatchJobFailed):
+            result = str(result)
+        elif isinstance(result, asyncio.CancelledError):
+            result = "Cancelled after an earlier job failed."
+        elif isinstance(result, BaseException):
+            logger.error(f"❌ Batch job failed: {result}")
+            result = f"Job failed: {result}"
+        summary.append({"job": job, "result": result})
+
+    logger.info(f"✅ Batch generation finished for {len(jobs)} job(s)")
+    return _json_dumps(summary, indent=True)
 
 @mcp.tool()
 async def get_task_status(
@@ -533,10 +1260,12 @@ async def get_task_status(
         logger.error(f"❌ Failed to fetch status for task {task_id}")
         return f"Failed to fetch status for task {task_id}."
     
-    task_status = status.get("task_status", "Unknown")
+    task_status = status.get("task_status", "Unknown") if isinstance(status, dict) else "Unknown"
     logger.info(f"✅ Task {task_id} status: {task_status}")
+    if task_status in TASK_TERMINAL_STATES:
+        _wake_poller(task_id)
     
-    return json.dumps(status, indent=2)
+    return _json_dumps(status, indent=True)
 
 @mcp.tool()
 async def upload_document(
@@ -559,39 +1288,34 @@ async def upload_document(
         logger.error("❌ API Key missing for upload_document")
         return "API Key is missing. Cannot process any requests."
 
-    url = f"{API_BASE}/document/upload"
-    headers = {
-        "User-Agent": USER_AGENT,
-        "X-API-Key": API_KEY,
-    }
-
-    # Validate path
-    if not os.path.isfile(file_path):
+    # Validate path (filesystem calls run off the event loop, like the read below)
+    if not await aiofiles.os.path.isfile(file_path):
         logger.error(f"❌ File not found: {file_path}")
         return f"File not found: {file_path}"
 
-    file_size = os.path.getsize(file_path)
-    logger.info(f"📁 File size: {file_size / 1024:.2f} KB")
-
     try:
-        async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-            with open(file_path, "rb") as f:
-                files = {"file": (os.path.basename(file_path), f)}
-                logger.info("⬆️  Uploading file...")
-                response = await client.post(url, headers=headers, files=files)
-                
-                logger.info(f"📥 Upload response status: {response.status_code}")
-                response.raise_for_status()
-                
-                data = response.json()
-                logger.info(f"✅ Document uploaded successfully")
-                if 'task_id' in data:
-                    logger.info(f"📋 Task ID: {data['task_id']}")
-                if 'document_uuid' in data:
-                    logger.info(f"🆔 Document UUID: {data['document_uuid']}")
-                    
-                return json.dumps(data, indent=2)
-                
+        # Read off the event loop so large uploads don't stall other tool calls
+        async with aiofiles.open(file_path, "rb") as f:
+            content = await f.read()
+        logger.info(f"📁 File size: {len(content) / 1024:.2f} KB")
+
+        files = {"file": (os.path.basename(file_path), content)}
+        logger.info("⬆️  Uploading file...")
+        async with _api_semaphore:
+            response = await _get_client().post("/document/upload", files=files)
+        
+        logger.info(f"📥 Upload response status: {response.status_code}")
+        response.raise_for_status()
+        
+        data = _json_loads(response.content)
+        logger.info(f"✅ Document uploaded successfully")
+        if 'task_id' in data:
+            logger.info(f"📋 Task ID: {data['task_id']}")
+        if 'document_uuid' in data:
+            logger.info(f"🆔 Document UUID: {data['document_uuid']}")
+            
+        return _json_dumps(data, indent=True)
+            
     except httpx.HTTPStatusError as e:
         logger.error(f"❌ HTTP error uploading document: {e.response.status_code}")
         logger.error(f"❌ Response: {e.response.text}")
@@ -602,11 +1326,7 @@ async def upload_document(
 
 # --- MCP Resources ---
 
-@mcp.resource("templates://list")
-def templates_resource() -> str:
-    """Resource endpoint to get template information"""
-    logger.info("📋 Templates resource accessed")
-    return """
+_TEMPLATES_RESOURCE = """
     SlideSpeak Templates Resource
     
     Use get_available_templates() to fetch the current list of templates.
@@ -618,11 +1338,13 @@ def templates_resource() -> str:
     Templates are regularly updated, so always fetch the latest list before generating.
     """
 
-@mcp.resource("api://documentation")
-def api_documentation() -> str:
-    """API documentation and usage guide"""
-    logger.info("📚 API documentation resource accessed")
-    return """
+@mcp.resource("templates://list")
+async def templates_resource() -> str:
+    """Resource endpoint to get template information"""
+    logger.debug("📋 Templates resource accessed")
+    return _TEMPLATES_RESOURCE
+
+_API_DOCUMENTATION = """
     SlideSpeak MCP API Documentation
     
     ## Authentication
@@ -642,9 +1364,10 @@ def api_documentation() -> str:
        - Generates presentation from text
        - Returns download URL for PPTX file
     
-    4. generate_slide_by_slide(template, slides, language?, fetch_images?)
+    4. generate_slide_by_slide(template, slides, language?, fetch_images?, chunk_size?)
        - Precise control over each slide
        - Define layout and content per slide
+       - chunk_size splits long decks into parts generated in parallel
     
     5. get_task_status(task_id)
        - Check status of generation tasks
@@ -654,6 +1377,11 @@ def api_documentation() -> str:
        - Upload documents to incorporate
        - Returns document UUID for use in generation
     
+    7. batch_generate(jobs, max_concurrent?, stop_on_error?)
+       - Runs several generate_powerpoint jobs concurrently
+       - Jobs with a "slides" entry run as generate_slide_by_slide instead
+       - Returns each job paired with its result
+    
     ## Rate Limits
     - Standard API rate limits apply
     - Generation tasks may take 30-90 seconds
@@ -663,13 +1391,15 @@ def api_documentation() -> str:
     - Check balance with get_me()
     """
 
+@mcp.resource("api://documentation")
+async def api_documentation() -> str:
+    """API documentation and usage guide"""
+    logger.debug("📚 API documentation resource accessed")
+    return _API_DOCUMENTATION
+
 # --- MCP Prompts ---
 
-@mcp.prompt("slidespeak_workflow")
-def slidespeak_workflow() -> str:
-    """Recommended workflow for using SlideSpeak"""
-    logger.info("💡 Workflow prompt accessed")
-    return """
+_WORKFLOW_PROMPT = """
     SlideSpeak Presentation Generation Workflow
     
     1. **Check your credits:**
@@ -720,11 +1450,13 @@ def slidespeak_workflow() -> str:
        - Share this URL with the user
     """
 
-@mcp.prompt("slide_layouts")
-def slide_layouts_guide() -> str:
-    """Guide for available slide layouts"""
-    logger.info("📐 Slide layouts prompt accessed")
-    return """
+@mcp.prompt("slidespeak_workflow")
+async def slidespeak_workflow() -> str:
+    """Recommended workflow for using SlideSpeak"""
+    logger.debug("💡 Workflow prompt accessed")
+    return _WORKFLOW_PROMPT
+
+_SLIDE_LAYOUTS_PROMPT = """
     SlideSpeak Slide Layouts Guide
     
     When using generate_slide_by_slide(), you can choose from these layouts:
@@ -756,8 +1488,26 @@ def slide_layouts_guide() -> str:
     Make sure item_amount matches the actual number of items!
     """
 
+@mcp.prompt("slide_layouts")
+async def slide_layouts_guide() -> str:
+    """Guide for available slide layouts"""
+    logger.debug("📐 Slide layouts prompt accessed")
+    return _SLIDE_LAYOUTS_PROMPT
+
 # --- Main Execution ---
 
+async def _serve(port: int) -> None:
+    """Run the MCP server and close the shared HTTP client on shutdown."""
+    try:
+        # Run FastMCP server with streamable-http transport for Railway deployment
+        await mcp.run_async(
+            transport="streamable-http",
+            host="0.0.0.0",  # Bind to all interfaces for cloud deployment
+            port=port
+        )
+    finally:
+        await _close_client()
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8080))
     
@@ -767,8 +1517,10 @@ if __name__ == "__main__":
     logger.info(f"📍 Port: {port}")
     logger.info(f"🌐 Base URL: {base_url}")
     logger.info(f"🔧 API Base: {API_BASE}")
+    logger.info(f"🔀 HTTP/2: {'enabled' if h2 is not None else 'unavailable (install httpx[http2])'}")
+    logger.info(f"📡 Status Streaming: {'enabled' if STATUS_STREAMING else 'disabled'}")
     logger.info(f"⏱️  Generation Timeout: {GENERATION_TIMEOUT}s")
-    logger.info(f"🔄 Polling Interval: {POLLING_INTERVAL}s")
+    logger.info(f"🔄 Polling Interval: {POLL_DELAYS[0]}s → {POLL_DELAYS[-1]}s")
     logger.info("=" * 60)
     
     if API_KEY:
@@ -784,9 +1536,14 @@ if __name__ == "__main__":
     logger.info("  Note: Health checks are handled via MCP protocol")
     logger.info("=" * 60)
     
-    # Run FastMCP server with streamable-http transport for Railway deployment
-    mcp.run(
-        transport="streamable-http",
-        host="0.0.0.0",  # Bind to all interfaces for cloud deployment
-        port=port
-    )
+    # Prefer uvloop's faster event loop where available (it doesn't support Windows)
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop is not None and sys.platform != "win32":
+        logger.info("⚡ Using uvloop event loop")
+        uvloop.run(_serve(port))
+    else:
+        asyncio.run(_serve(port))